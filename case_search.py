@@ -19,23 +19,47 @@ import hashlib
 import random
 import time
 import requests
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from collections import deque
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from groq import Groq
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from urllib.parse import urljoin, urlparse
 
+from json_store import (
+    append_json_lines,
+    dump_json_bytes,
+    migrate_legacy_jsonl,
+    parse_json,
+    read_json_lines,
+)
+
 # ==================================================
 # FILES
 # ==================================================
 
 OUT_FILE = Path("case.json")
 MEMORY_DIR = Path("memory")
-USED_CASES_FILE = MEMORY_DIR / "used_cases.json"
-USED_ARTICLES_FILE = MEMORY_DIR / "used_articles.json"
-CASE_HISTORY_FILE = MEMORY_DIR / "case_history.json"
+USED_CASES_FILE = MEMORY_DIR / "used_cases.jsonl"
+LEGACY_USED_CASES_FILE = MEMORY_DIR / "used_cases.json"
+USED_ARTICLES_FILE = MEMORY_DIR / "used_articles.jsonl"
+LEGACY_USED_ARTICLES_FILE = MEMORY_DIR / "used_articles.json"
+CASE_HISTORY_FILE = MEMORY_DIR / "case_history.jsonl"
+LEGACY_CASE_HISTORY_FILE = MEMORY_DIR / "case_history.json"
 MEMORY_DIR.mkdir(exist_ok=True)
 
+# Feed validators + parsed links churn every run, so they live in the
+# gitignored cache dir rather than the committed memory/ (CI restores
+# it with actions/cache)
+CACHE_DIR = Path(".cache")
+FEED_CACHE_FILE = CACHE_DIR / "feed_cache.json"
+CACHE_DIR.mkdir(exist_ok=True)
+
 # ==================================================
 # CONFIG
 # ==================================================
@@ -134,9 +158,51 @@ TRUE_CRIME_SITES = [
 ]
 
 MAX_TEXT_LEN = 3000
+# Article pages are cut off here; the story text sits well before the cap
+MAX_PAGE_BYTES = 2 * 1024 * 1024
 MIN_TEXT_LEN = 500
 MAX_RETRIES = 3
 RETRY_DELAY = 2
+# Client errors worth retrying; any other 4xx is final (dead or blocked link)
+RETRYABLE_CLIENT_STATUSES = (408, 425, 429)
+FETCH_WORKERS = 8
+# Candidates fetched + LLM-extracted concurrently; small to stay inside
+# Groq's per-minute request limit and to waste few calls after a hit
+EXTRACT_WORKERS = 3
+
+# Linked files that can never yield article text
+NON_ARTICLE_EXTENSIONS = (
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg",
+    ".pdf", ".mp3", ".mp4", ".m3u8", ".zip",
+)
+
+# Listing pages are only mined for links: parse just the <a href> tags
+LINK_STRAINER = SoupStrainer("a", href=True)
+
+# Compiled once; clean() runs on every article and LLM field
+WHITESPACE_RE = re.compile(r"\s+")
+
+# An article naming none of these has no case to extract; checked before
+# the LLM call. Deliberately broad: a false reject loses a case for good
+CRIME_TERMS_RE = re.compile(
+    r"\b(?:kill|murder|homicide|manslaughter|dead|death|died|body|bodies"
+    r"|shot|shooting|stabb|strangl|victim|police|detective|investigat"
+    r"|suspect|arrest|charged|missing|coroner|autopsy)",
+    re.IGNORECASE,
+)
+
+# Dated URL paths (/2024/05/) mark articles on true crime sites
+DATED_PATH_RE = re.compile(r"/\d{4}/\d{2}/")
+
+# Site paths that are listings or account pages, never articles
+EXCLUDED_PATH_PARTS = ("login", "signup", "subscribe", "category", "tag", "author", "search")
+
+# One keep-alive session for every fetch: feeds and articles repeat the
+# same hosts, so pooled connections skip a TCP+TLS handshake per request
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=FETCH_WORKERS))
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=FETCH_WORKERS))
 
 # ==================================================
 # DUPLICATE PREVENTION
@@ -147,47 +213,68 @@ def load_json_file(filepath, default=None):
     if not filepath.exists():
         if default is None:
             default = []
-        filepath.write_text(json.dumps(default))
+        filepath.write_bytes(dump_json_bytes(default))
         return default
     try:
-        return json.loads(filepath.read_text())
+        return parse_json(filepath.read_bytes())
     except:
         return default if default else []
 
 def save_json_file(filepath, data):
-    """Safely save JSON file"""
+    """Safely save JSON file (atomic: a crash never leaves a truncated file)"""
     try:
-        filepath.write_text(json.dumps(data, indent=2))
+        tmp = filepath.with_suffix(filepath.suffix + ".tmp")
+        tmp.write_bytes(dump_json_bytes(data))
+        os.replace(tmp, filepath)
     except Exception as e:
         print(f"⚠️ Warning: Could not save {filepath.name}: {e}")
 
 def load_used_cases():
     """Load set of used case fingerprints"""
-    return set(load_json_file(USED_CASES_FILE, []))
+    migrate_legacy_jsonl(LEGACY_USED_CASES_FILE, USED_CASES_FILE)
+    return set(read_json_lines(USED_CASES_FILE))
 
 def load_used_articles():
     """Load set of used article URLs/fingerprints"""
-    return set(load_json_file(USED_ARTICLES_FILE, []))
+    migrate_legacy_jsonl(LEGACY_USED_ARTICLES_FILE, USED_ARTICLES_FILE)
+    return set(read_json_lines(USED_ARTICLES_FILE))
+
+def save_used(filepath, new_fps, used):
+    """Record newly used fingerprints, appending only the new ones"""
+    fresh = [fp for fp in dict.fromkeys(new_fps) if fp not in used]
+    used.update(fresh)
+    if fresh:
+        append_json_lines(filepath, fresh)
 
 def load_case_history():
     """Load full history of cases for deep duplicate checking"""
-    return load_json_file(CASE_HISTORY_FILE, [])
+    migrate_legacy_jsonl(LEGACY_CASE_HISTORY_FILE, CASE_HISTORY_FILE)
+    return read_json_lines(CASE_HISTORY_FILE)
 
-def save_case_to_history(case):
-    """Save case to history for future duplicate checking"""
-    history = load_case_history()
-    history.append({
+def save_case_to_history(case, history):
+    """Append case to history for future duplicate checking (O(1) write)"""
+    entry = {
         "case": case,
         "timestamp": datetime.now().isoformat(),
-    })
-    save_json_file(CASE_HISTORY_FILE, history)
+    }
+    history.append(entry)
+    append_json_lines(CASE_HISTORY_FILE, [entry])
 
+@lru_cache(maxsize=512)
 def fingerprint(text):
-    """Generate SHA256 fingerprint of text"""
+    """Generate a 128-bit BLAKE2b fingerprint of text (dedup key, not security)"""
+    return hashlib.blake2b(text.lower().encode(), digest_size=16).hexdigest()
+
+def legacy_fingerprint(text):
+    """SHA256 fingerprint written by earlier runs"""
     return hashlib.sha256(text.lower().encode()).hexdigest()
 
-def generate_case_fingerprint(case):
-    """Generate unique fingerprint for a case based on multiple fields"""
+def is_used(text, used):
+    """True if text was seen before, under either fingerprint scheme"""
+    return fingerprint(text) in used or legacy_fingerprint(text) in used
+
+def case_key(case):
+    """Normalized text that identifies a case"""
     # Combine multiple fields for robust duplicate detection
     components = [
         case.get("full_name", "").lower().strip(),
@@ -196,15 +283,17 @@ def generate_case_fingerprint(case):
         # Use first 100 chars of summary for similarity
         case.get("summary", "")[:100].lower().strip(),
     ]
-    combined = "|".join(components)
-    return fingerprint(combined)
+    return "|".join(components)
+
+def generate_case_fingerprint(case):
+    """Generate unique fingerprint for a case based on multiple fields"""
+    return fingerprint(case_key(case))
 
 def is_duplicate_case(case, used_fingerprints, history):
     """Check if case is duplicate using multiple methods"""
     
     # Method 1: Exact fingerprint match
-    case_fp = generate_case_fingerprint(case)
-    if case_fp in used_fingerprints:
+    if is_used(case_key(case), used_fingerprints):
         print("  ⏭️  Duplicate: Exact fingerprint match")
         return True
     
@@ -212,185 +301,316 @@ def is_duplicate_case(case, used_fingerprints, history):
     new_name = case.get("full_name", "").lower().strip()
     new_location = case.get("location", "").lower().strip()
     
-    for hist_entry in history:
-        hist_case = hist_entry["case"]
-        hist_name = hist_case.get("full_name", "").lower().strip()
-        hist_location = hist_case.get("location", "").lower().strip()
-        
-        # Skip generic placeholder names
-        if "not publicly released" in new_name or "not publicly released" in hist_name:
-            continue
+    # Skip generic placeholder names; the new case's side is loop-invariant
+    if new_name and "not publicly released" not in new_name:
+        # Extract key parts (first and last name) once, not per history entry
+        new_parts = set(new_name.split())
         
-        # Check name similarity (allowing for middle names, etc.)
-        if new_name and hist_name:
-            # Extract key parts (first and last name)
-            new_parts = set(new_name.split())
-            hist_parts = set(hist_name.split())
+        for hist_entry in history:
+            hist_case = hist_entry["case"]
+            hist_name = hist_case.get("full_name", "").lower().strip()
             
-            # If 2+ name parts match and location matches
-            if len(new_parts & hist_parts) >= 2 and new_location == hist_location:
+            if not hist_name or "not publicly released" in hist_name:
+                continue
+            
+            # Cheap location compare before building the name set
+            if hist_case.get("location", "").lower().strip() != new_location:
+                continue
+            
+            # If 2+ name parts match (allowing for middle names, etc.)
+            if len(new_parts & set(hist_name.split())) >= 2:
                 print(f"  ⏭️  Duplicate: Similar name + location ({new_name} ≈ {hist_name})")
                 return True
     
     # Method 3: Summary text similarity (crude check)
     new_summary = case.get("summary", "").lower()
-    for hist_entry in history[-50:]:  # Check last 50 cases
-        hist_summary = hist_entry["case"].get("summary", "").lower()
-        if len(new_summary) > 100 and len(hist_summary) > 100:
-            # Check for significant overlap (>70% of words)
-            new_words = set(new_summary.split())
-            hist_words = set(hist_summary.split())
-            overlap = len(new_words & hist_words) / max(len(new_words), len(hist_words))
-            if overlap > 0.7:
-                print(f"  ⏭️  Duplicate: High summary similarity ({overlap:.0%})")
-                return True
+    if len(new_summary) > 100:
+        new_words = set(new_summary.split())
+        for hist_entry in history[-50:]:  # Check last 50 cases
+            hist_summary = hist_entry["case"].get("summary", "").lower()
+            if len(hist_summary) > 100:
+                # Check for significant overlap (>70% of words)
+                hist_words = set(hist_summary.split())
+                overlap = len(new_words & hist_words) / max(len(new_words), len(hist_words))
+                if overlap > 0.7:
+                    print(f"  ⏭️  Duplicate: High summary similarity ({overlap:.0%})")
+                    return True
     
     return False
 
 def clean(t):
     """Clean and normalize text"""
-    return re.sub(r"\s+", " ", t).strip()
+    return WHITESPACE_RE.sub(" ", t).strip()
 
 # ==================================================
 # NETWORK WITH RETRY
 # ==================================================
 
-def fetch_with_retry(url, timeout=20):
+def fetch_with_retry(url, timeout=20, stream=False, headers=None):
     """Fetch URL with exponential backoff retry"""
     for attempt in range(MAX_RETRIES):
         try:
-            r = requests.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
+            r = SESSION.get(url, timeout=timeout, allow_redirects=True, stream=stream, headers=headers)
             r.raise_for_status()
             return r
         except Exception as e:
+            status = getattr(getattr(e, "response", None), "status_code", None) or 0
+            if 400 <= status < 500 and status not in RETRYABLE_CLIENT_STATUSES:
+                print(f"  ❌ HTTP {status}, not retrying: {url[:80]}")
+                return None
             if attempt < MAX_RETRIES - 1:
                 wait = RETRY_DELAY * (2 ** attempt) + random.uniform(0, 1)
-                print(f"  ⚠️ Retry {attempt + 1}/{MAX_RETRIES} after {wait:.1f}s")
+                print(f"  ⚠️ Retry {attempt + 1}/{MAX_RETRIES} after {wait:.1f}s: {url[:80]}")
                 time.sleep(wait)
             else:
-                print(f"  ❌ Failed after {MAX_RETRIES} attempts: {str(e)[:100]}")
+                print(f"  ❌ Failed after {MAX_RETRIES} attempts: {url[:80]}: {str(e)[:100]}")
     return None
 
 # ==================================================
 # ARTICLE FETCHING
 # ==================================================
 
+def _local_name(tag):
+    """Tag name without its XML namespace"""
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+def parse_feed_links(content):
+    """Stream RSS <item> / Atom <entry> links out of raw feed bytes"""
+    links = []
+
+    for _, el in ET.iterparse(BytesIO(content), events=("end",)):
+        if _local_name(el.tag) not in ("item", "entry"):
+            continue
+
+        link = None
+        link_el = guid_el = None
+        for child in el.iter():
+            name = _local_name(child.tag)
+            if name == "link" and link_el is None:
+                link_el = child
+            elif name == "guid" and guid_el is None:
+                guid_el = child
+
+        if link_el is not None:
+            link = link_el.text.strip() if link_el.text else link_el.get("href")
+        elif guid_el is not None:
+            guid = (guid_el.text or "").strip()
+            if guid.startswith("http"):
+                link = guid
+
+        if link:
+            links.append(link.strip())
+
+        el.clear()  # drop the finished item; keeps memory flat
+
+    return links
+
+def read_feed_links(r):
+    """Article links from a feed response, lenient parser as fallback"""
+    try:
+        return parse_feed_links(r.content)
+    except ET.ParseError:
+        pass  # malformed feed: fall back to the lenient parser below
+
+    soup = BeautifulSoup(r.text, "xml")
+
+    # Try different RSS formats
+    items = soup.find_all("item") or soup.find_all("entry")
+
+    links = []
+    for item in items:
+        # Try multiple link formats
+        link = None
+        if item.find("link"):
+            link_tag = item.find("link")
+            link = link_tag.text.strip() if link_tag.text else link_tag.get("href")
+        elif item.find("guid"):
+            guid = item.find("guid").text.strip()
+            if guid.startswith("http"):
+                link = guid
+
+        if link:
+            links.append(link.strip())
+
+    return links
+
+def fetch_feed_links(feed, cache=None):
+    """
+    Fetch a single RSS/Atom feed and return its article links.
+    With a cache, the request is conditional on the feed's last
+    ETag/Last-Modified; a 304 reuses the links parsed last time.
+    """
+    entry = cache.get(feed) if cache is not None else None
+    headers = {}
+    if entry and entry.get("links"):
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    r = fetch_with_retry(feed, timeout=15, headers=headers)
+    if not r:
+        return []
+
+    if r.status_code == 304 and headers:
+        return entry["links"]
+
+    links = read_feed_links(r)
+
+    if cache is not None:
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        if links and (etag or last_modified):
+            cache[feed] = {"etag": etag, "last_modified": last_modified, "links": links}
+        else:
+            cache.pop(feed, None)
+
+    return links
+
+def is_media_link(href):
+    """Links to images, documents or media files are never articles"""
+    return urlparse(href).path.lower().endswith(NON_ARTICLE_EXTENSIONS)
+
+def fetch_site_links(site):
+    """Fetch one crime news site and return its article-like links"""
+    r = fetch_with_retry(site["url"], timeout=15)
+    if not r:
+        return []
+
+    soup = BeautifulSoup(r.content, "lxml", parse_only=LINK_STRAINER)
+
+    links = []
+    # Find all links
+    for a in soup.find_all("a", href=True):
+        href = a["href"]
+
+        # Convert relative to absolute URLs
+        if not href.startswith("http"):
+            href = urljoin(site["url"], href)
+
+        if is_media_link(href):
+            continue
+
+        # Filter for article-like URLs
+        parsed = urlparse(href)
+        if parsed.netloc and len(parsed.path) > 10:
+            # Exclude common non-article paths
+            href_lower = href.lower()
+            if not any(ex in href_lower for ex in EXCLUDED_PATH_PARTS):
+                links.append(href)
+
+    return links
+
+def fetch_true_crime_links(url):
+    """Fetch one true crime site and return its article links"""
+    r = fetch_with_retry(url, timeout=15)
+    if not r:
+        return []
+
+    soup = BeautifulSoup(r.content, "lxml", parse_only=LINK_STRAINER)
+
+    links = []
+    for a in soup.find_all("a", href=True):
+        href = a["href"]
+        if not href.startswith("http"):
+            href = urljoin(url, href)
+
+        if is_media_link(href):
+            continue
+
+        # Look for article patterns
+        if DATED_PATH_RE.search(href) or "article" in href or "story" in href:
+            links.append(href)
+
+    return links
+
+def gather_links(fetch_one, sources, describe, label):
+    """
+    Run fetch_one over every source in parallel and merge the links.
+    Sources are independent, so wall time is roughly the slowest
+    source instead of the sum of all round-trips.
+    """
+    links = []
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        futures = {pool.submit(fetch_one, src): src for src in sources}
+
+        for i, future in enumerate(as_completed(futures), 1):
+            src = futures[future]
+            try:
+                found = future.result()
+                print(f"  [{i}/{len(sources)}] {describe(src)} ({len(found)} links)")
+                links.extend(found)
+            except Exception as e:
+                print(f"  ⚠️ {label} error: {str(e)[:100]}")
+
+    return links
+
+def prefetch(fetch_one, items, ahead=FETCH_WORKERS):
+    """
+    Yield (item, fetch_one(item)) in input order while keeping up to
+    `ahead` calls in flight, so the caller works on one result while
+    the next few download. Stopping early cancels what hasn't started;
+    calls already running are not interrupted.
+    """
+    pool = ThreadPoolExecutor(max_workers=ahead)
+    pending = deque()
+    items = iter(items)
+
+    try:
+        for item in items:
+            pending.append((item, pool.submit(fetch_one, item)))
+            if len(pending) >= ahead:
+                break
+
+        while pending:
+            item, future = pending.popleft()
+            for nxt in items:
+                pending.append((nxt, pool.submit(fetch_one, nxt)))
+                break
+            yield item, future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 def fetch_articles_from_rss():
     """Fetch article links from all RSS feeds"""
-    links = []
     print("🔍 Fetching from RSS feeds...")
-    
-    for i, feed in enumerate(CRIME_RSS_FEEDS, 1):
-        try:
-            print(f"  [{i}/{len(CRIME_RSS_FEEDS)}] {feed[:60]}...")
-            r = fetch_with_retry(feed, timeout=15)
-            if not r:
-                continue
-            
-            soup = BeautifulSoup(r.text, "xml")
-            
-            # Try different RSS formats
-            items = soup.find_all("item") or soup.find_all("entry")
-            
-            for item in items:
-                # Try multiple link formats
-                link = None
-                if item.find("link"):
-                    link_tag = item.find("link")
-                    link = link_tag.text.strip() if link_tag.text else link_tag.get("href")
-                elif item.find("guid"):
-                    guid = item.find("guid").text.strip()
-                    if guid.startswith("http"):
-                        link = guid
-                
-                if link:
-                    links.append(link.strip())
-            
-            time.sleep(0.5)  # Rate limiting
-            
-        except Exception as e:
-            print(f"  ⚠️ RSS error: {str(e)[:100]}")
-    
+    cache = load_json_file(FEED_CACHE_FILE, {})
+    if not isinstance(cache, dict):
+        cache = {}
+
+    fetch = partial(fetch_feed_links, cache=cache)
+    links = gather_links(fetch, CRIME_RSS_FEEDS, lambda f: f"{f[:60]}...", "RSS")
+
+    # Drop feeds that were removed from the source list
+    save_json_file(FEED_CACHE_FILE, {f: cache[f] for f in CRIME_RSS_FEEDS if f in cache})
     print(f"  ✓ Got {len(links)} links from RSS")
     return links
 
 def fetch_articles_from_sites():
     """Fetch article links from direct news sites"""
-    links = []
     print("🔍 Fetching from crime news sites...")
-    
-    for i, site in enumerate(CRIME_NEWS_SITES, 1):
-        try:
-            print(f"  [{i}/{len(CRIME_NEWS_SITES)}] {site['name']}...")
-            r = fetch_with_retry(site["url"], timeout=15)
-            if not r:
-                continue
-            
-            soup = BeautifulSoup(r.text, "html.parser")
-            
-            # Find all links
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
-                
-                # Convert relative to absolute URLs
-                if not href.startswith("http"):
-                    href = urljoin(site["url"], href)
-                
-                # Filter for article-like URLs
-                parsed = urlparse(href)
-                if parsed.netloc and len(parsed.path) > 10:
-                    # Exclude common non-article paths
-                    exclude = ["login", "signup", "subscribe", "category", "tag", "author", "search"]
-                    if not any(ex in href.lower() for ex in exclude):
-                        links.append(href)
-            
-            time.sleep(1)  # Rate limiting
-            
-        except Exception as e:
-            print(f"  ⚠️ Site error: {str(e)[:100]}")
-    
+    links = gather_links(fetch_site_links, CRIME_NEWS_SITES, lambda s: s["name"], "Site")
     print(f"  ✓ Got {len(links)} links from sites")
     return links
 
 def fetch_articles_from_true_crime():
     """Fetch from true crime focused sites"""
-    links = []
     print("🔍 Fetching from true crime sites...")
-    
-    for i, url in enumerate(TRUE_CRIME_SITES, 1):
-        try:
-            print(f"  [{i}/{len(TRUE_CRIME_SITES)}] {url}...")
-            r = fetch_with_retry(url, timeout=15)
-            if not r:
-                continue
-            
-            soup = BeautifulSoup(r.text, "html.parser")
-            
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
-                if not href.startswith("http"):
-                    href = urljoin(url, href)
-                
-                # Look for article patterns
-                if re.search(r'/\d{4}/\d{2}/', href) or "article" in href or "story" in href:
-                    links.append(href)
-            
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"  ⚠️ True crime site error: {str(e)[:100]}")
-    
+    links = gather_links(fetch_true_crime_links, TRUE_CRIME_SITES, lambda u: u, "True crime site")
     print(f"  ✓ Got {len(links)} links from true crime sites")
     return links
 
 def fetch_all_articles():
     """Fetch articles from all sources"""
     all_links = []
-    
-    # Fetch from all sources
-    all_links.extend(fetch_articles_from_rss())
-    all_links.extend(fetch_articles_from_sites())
-    all_links.extend(fetch_articles_from_true_crime())
+    groups = (fetch_articles_from_rss, fetch_articles_from_sites, fetch_articles_from_true_crime)
+
+    # The three groups hit disjoint hosts, so run them side by side;
+    # the pass then takes as long as the slowest group, not all three
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        for found in pool.map(lambda fetch: fetch(), groups):
+            all_links.extend(found)
     
     # Remove duplicates and shuffle
     all_links = list(set(all_links))
@@ -432,14 +652,36 @@ def extract_text_method_4(soup):
         return clean(article_body.get_text())
     return ""
 
+def read_capped(r, limit):
+    """Read a streamed response body, stopping after limit bytes"""
+    chunks = []
+    size = 0
+    for chunk in r.iter_content(chunk_size=64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b"".join(chunks)
+
 def fetch_article_text(url):
-    """Fetch and extract article text using multiple methods"""
+    """
+    Fetch and extract article text using multiple methods.
+    Returns (text, None), or (None, reason) when no usable text was found.
+    """
     try:
-        r = fetch_with_retry(url, timeout=15)
+        r = fetch_with_retry(url, timeout=15, stream=True)
         if not r:
-            return None
+            return None, "Could not fetch article"
         
-        soup = BeautifulSoup(r.text, "html.parser")
+        # Headers arrive first: skip non-HTML bodies without downloading them
+        with r:
+            content_type = r.headers.get("Content-Type", "").lower()
+            if content_type and "html" not in content_type:
+                return None, f"Not an HTML page ({content_type})"
+            body = read_capped(r, MAX_PAGE_BYTES)
+            encoding = r.encoding if "charset" in content_type else None
+        
+        soup = BeautifulSoup(body, "lxml", from_encoding=encoding)
         
         # Remove noise
         for tag in soup(["script", "style", "nav", "footer", "header", "aside", "iframe", "form"]):
@@ -457,12 +699,12 @@ def fetch_article_text(url):
         valid_texts = [t for t in texts if len(t) >= MIN_TEXT_LEN]
         if valid_texts:
             text = max(valid_texts, key=len)
-            return text[:MAX_TEXT_LEN]
+            return text[:MAX_TEXT_LEN], None
             
     except Exception as e:
-        print(f"  ⚠️ Text extraction error: {str(e)[:100]}")
+        return None, f"Text extraction error: {str(e)[:100]}"
     
-    return None
+    return None, "Could not extract text"
 
 # ==================================================
 # AI EXTRACTION
@@ -520,7 +762,10 @@ def validate_case_fields(case):
     return True, "Valid"
 
 def extract_case(client, text):
-    """Extract structured case data from article text"""
+    """
+    Extract structured case data from article text.
+    Returns (case, None), or (None, reason) when extraction fails.
+    """
     
     prompt = f"""You are extracting crime case information from a news article.
 
@@ -569,31 +814,54 @@ Return ONLY valid JSON or empty object:"""
             content = content.split("```")[1].split("```")[0].strip()
         
         # Parse JSON
-        case = json.loads(content)
+        case = parse_json(content)
         
         # Empty object means extraction failed
         if not case or len(case) == 0:
-            return None
+            return None, "No case in article"
         
         # Validate fields
         valid, msg = validate_case_fields(case)
         if not valid:
-            print(f"  ⚠️ Validation failed: {msg}")
-            return None
+            return None, f"Validation failed: {msg}"
         
         # Clean all fields
         for field in case:
             if isinstance(case[field], str):
                 case[field] = clean(case[field])
         
-        return case
+        return case, None
         
     except json.JSONDecodeError as e:
-        print(f"  ⚠️ JSON parse error: {e}")
-        return None
+        return None, f"JSON parse error: {e}"
     except Exception as e:
-        print(f"  ⚠️ LLM extraction error: {e}")
-        return None
+        return None, f"LLM extraction error: {e}"
+
+def process_candidate(link, client, used_articles):
+    """
+    Fetch, screen and extract one candidate article. Nothing here depends
+    on other candidates, so several can run at once. Returns
+    (article_text, case, skip_reason); skip_reason is None on success.
+    Failures come back as skip_reason rather than being printed, so the
+    main loop logs them under the right candidate.
+    """
+    article_text, error = fetch_article_text(link)
+    if not article_text:
+        return None, None, error
+    
+    # Check if article content already used
+    if is_used(article_text, used_articles):
+        return article_text, None, "Article content already processed"
+    
+    # Cheap reject before spending an LLM call on the article
+    if not CRIME_TERMS_RE.search(article_text):
+        return article_text, None, "No crime or death terms in article"
+    
+    case, error = extract_case(client, article_text)
+    if not case:
+        return article_text, None, error
+    
+    return article_text, case, None
 
 # ==================================================
 # MAIN
@@ -627,34 +895,24 @@ def main():
     print(f"🔎 Processing up to 100 articles to find unique case...")
     print(f"{'='*60}\n")
     
-    # Try to extract a valid, unique case
-    for i, link in enumerate(links[:100], 1):
-        print(f"📄 [{i}/100] {link[:70]}...")
-        
-        # Check if article URL already used
-        url_fp = fingerprint(link)
-        if url_fp in used_articles:
-            print("  ⏭️  Article URL already processed")
-            continue
-        
-        # Fetch article text
-        article_text = fetch_article_text(link)
-        if not article_text:
-            print("  ⏭️  Could not extract text")
-            continue
+    # Check article URLs up front so only new ones are downloaded
+    candidates = [link for link in links[:100] if not is_used(link, used_articles)]
+    if len(candidates) < len(links[:100]):
+        print(f"⏭️  {len(links[:100]) - len(candidates)} article URLs already processed")
+    
+    # Try to extract a valid, unique case. Candidates are fetched and
+    # extracted a few at a time ahead of the loop, but still judged in
+    # list order, so the same case wins as with one-by-one processing.
+    # Returning on success cancels candidates not yet started, but up to
+    # EXTRACT_WORKERS - 1 Groq calls already in flight still run to the
+    # end, and interpreter exit waits for them before the process quits
+    work = partial(process_candidate, client=client, used_articles=used_articles)
+    results = prefetch(work, candidates, ahead=EXTRACT_WORKERS)
+    for i, (link, (article_text, case, skipped)) in enumerate(results, 1):
+        print(f"📄 [{i}/{len(candidates)}] {link[:70]}...")
         
-        # Check if article content already used
-        article_fp = fingerprint(article_text)
-        if article_fp in used_articles:
-            print("  ⏭️  Article content already processed")
-            continue
-        
-        # Extract case
-        print("  🤖 Extracting case data...")
-        case = extract_case(client, article_text)
-        
-        if not case:
-            print("  ⏭️  Extraction failed or invalid data")
+        if skipped:
+            print(f"  ⏭️  {skipped}")
             continue
         
         # Check for duplicates
@@ -671,17 +929,12 @@ def main():
         print(f"{'='*60}\n")
         
         # Save case
-        OUT_FILE.write_text(json.dumps(case, indent=2), encoding="utf-8")
+        OUT_FILE.write_bytes(dump_json_bytes(case))
         
         # Update tracking
-        case_fp = generate_case_fingerprint(case)
-        used_cases.add(case_fp)
-        used_articles.add(url_fp)
-        used_articles.add(article_fp)
-        
-        save_json_file(USED_CASES_FILE, sorted(used_cases))
-        save_json_file(USED_ARTICLES_FILE, sorted(used_articles))
-        save_case_to_history(case)
+        save_used(USED_CASES_FILE, [generate_case_fingerprint(case)], used_cases)
+        save_used(USED_ARTICLES_FILE, [fingerprint(link), fingerprint(article_text)], used_articles)
+        save_case_to_history(case, case_history)
         
         print("💾 Case saved to case.json")
         print("📝 Tracking data updated")
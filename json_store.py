@@ -0,0 +1,77 @@
+"""
+JSON STORE — SHARED JSON / JSONL HELPERS
+========================================
+
+Used by case_search.py and script.py, which read and write the same
+files under memory/. orjson is used when installed; stdlib json
+otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+
+def dump_json_bytes(data):
+    """Serialize to indented JSON bytes (orjson when available)"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def dump_json_line(data):
+    """Serialize one compact JSON line for append-only logs"""
+    if orjson:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data).encode() + b"\n"
+
+
+def parse_json(raw):
+    """Parse JSON bytes or str (orjson when available)"""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# ==================================================
+# APPEND-ONLY JSONL
+# ==================================================
+
+def migrate_legacy_jsonl(legacy_file, jsonl_file):
+    """One-time conversion of an old whole-file JSON list to JSONL"""
+    if jsonl_file.exists() or not legacy_file.exists():
+        return
+    try:
+        legacy = parse_json(legacy_file.read_bytes())
+    except Exception:
+        legacy = []
+    jsonl_file.write_bytes(b"".join(dump_json_line(e) for e in legacy))
+    legacy_file.unlink()
+
+
+def read_json_lines(filepath):
+    """Read every entry of an append-only JSONL file"""
+    if not filepath.exists():
+        return []
+
+    entries = []
+    for line in filepath.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        try:
+            entries.append(parse_json(line))
+        except Exception:
+            continue  # torn trailing line from an interrupted append
+    return entries
+
+
+def append_json_lines(filepath, entries):
+    """Append entries to a JSONL file (O(1) in the size of the file)"""
+    try:
+        with filepath.open("ab") as f:
+            f.write(b"".join(dump_json_line(e) for e in entries))
+    except Exception as e:
+        print(f"⚠️ Warning: Could not save {filepath.name}: {e}")
@@ -11,11 +11,18 @@ OUTPUT RULES:
 """
 
 import os
-import json
 import random
 from pathlib import Path
 from groq import Groq
 
+from json_store import (
+    append_json_lines,
+    dump_json_bytes,
+    migrate_legacy_jsonl,
+    parse_json,
+    read_json_lines,
+)
+
 # ==================================================
 # FILES
 # ==================================================
@@ -24,7 +31,8 @@ SCRIPT_FILE = Path("script.txt")
 CASE_FILE = Path("case.json")
 
 MEMORY_DIR = Path("memory")
-USED_CASES_FILE = MEMORY_DIR / "used_cases.json"
+USED_CASES_FILE = MEMORY_DIR / "used_cases.jsonl"
+LEGACY_USED_CASES_FILE = MEMORY_DIR / "used_cases.json"
 USED_HOOKS_FILE = MEMORY_DIR / "used_hooks.json"
 
 MEMORY_DIR.mkdir(exist_ok=True)
@@ -36,7 +44,7 @@ MEMORY_DIR.mkdir(exist_ok=True)
 if not CASE_FILE.exists():
     raise RuntimeError("❌ case.json missing")
 
-CASE = json.loads(CASE_FILE.read_text(encoding="utf-8"))
+CASE = parse_json(CASE_FILE.read_bytes())
 
 REQUIRED_FIELDS = [
     "full_name",
@@ -58,11 +66,20 @@ for f in REQUIRED_FIELDS:
 
 def load_json(path: Path, default):
     if not path.exists():
-        path.write_text(json.dumps(default, indent=2))
-    return json.loads(path.read_text())
+        path.write_bytes(dump_json_bytes(default))
+    return parse_json(path.read_bytes())
 
 def save_json(path: Path, data):
-    path.write_text(json.dumps(data, indent=2))
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(dump_json_bytes(data))
+    os.replace(tmp, path)
+
+# used_cases is shared with case_search.py: one JSON string per line,
+# appended to, never rewritten
+
+def load_used_cases() -> set:
+    migrate_legacy_jsonl(LEGACY_USED_CASES_FILE, USED_CASES_FILE)
+    return set(read_json_lines(USED_CASES_FILE))
 
 def fingerprint(case):
     return f"{case['full_name']}|{case['location']}|{case['date']}|{case['time']}".lower()
@@ -165,7 +182,7 @@ Return only four lines.
 # ==================================================
 
 def main():
-    used_cases = load_json(USED_CASES_FILE, [])
+    used_cases = load_used_cases()
     used_hooks = load_json(USED_HOOKS_FILE, [])
 
     cid = fingerprint(CASE)
@@ -195,8 +212,7 @@ def main():
 
     SCRIPT_FILE.write_text("\n".join(script), encoding="utf-8")
 
-    used_cases.append(cid)
-    save_json(USED_CASES_FILE, used_cases)
+    append_json_lines(USED_CASES_FILE, [cid])
     save_json(USED_HOOKS_FILE, used_hooks)
 
     print("✅ Script generated successfully\n")
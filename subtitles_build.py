@@ -10,6 +10,7 @@ YouTube Shorts Subtitle Generator — FIXED VERSION
 """
 
 import json
+from bisect import bisect_left
 from pathlib import Path
 from faster_whisper import WhisperModel
 
@@ -54,6 +55,9 @@ EMPHASIS_WORDS = {
     "mysterious", "mystery", "suspicious", "strange", "unknown",
 }
 
+# Words per subtitle: durations above each bound get one more word
+CHUNK_DURATION_BOUNDS = (1.5, 3.0, 5.0)
+
 # ==================================================
 # HELPERS
 # ==================================================
@@ -78,14 +82,7 @@ def split_into_chunks(text: str, max_words: int) -> list:
 
 def get_optimal_chunk_size(duration: float) -> int:
     """Calculate optimal words per subtitle based on duration"""
-    if duration > 5:
-        return 4
-    elif duration > 3:
-        return 3
-    elif duration > 1.5:
-        return 2
-    else:
-        return 1
+    return bisect_left(CHUNK_DURATION_BOUNDS, duration) + 1
 
 # ==================================================
 # ASS HEADER
@@ -11,19 +11,19 @@ Crime Whisper Mode + Adaptive Emotion (SAFE)
 
 import os
 import argparse
+import hashlib
 import re
+import subprocess
 import sys
-import tempfile
 from typing import List, Optional
 
 # Environment safety
 os.environ["COQUI_TOS_AGREED"] = "1"
 os.environ["TORCH_FORCE_NO_WEIGHTS_ONLY_LOAD"] = "1"
 
+import numpy as np
 import torch
 from TTS.api import TTS
-from pydub import AudioSegment, effects
-from pydub.effects import compress_dynamic_range
 
 
 # ==================================================
@@ -31,6 +31,7 @@ from pydub.effects import compress_dynamic_range
 # ==================================================
 
 VOICES_DIR = os.path.abspath("voices")
+VOICE_EXTENSIONS = (".wav", ".mp3")
 
 DEFAULT_MODEL = os.environ.get(
     "TTS_MODEL_NAME",
@@ -45,6 +46,28 @@ MAX_WORDS_FIRM = 20
 CROSSFADE_MS = 60              # Natural flow
 OUTPUT_RATE = 44100
 
+NORMALIZE_HEADROOM_DB = 0.1   # Peak target below full scale
+NORMALIZE_PEAK = 10 ** (-NORMALIZE_HEADROOM_DB / 20)
+PCM16_FULL_SCALE = 32767
+
+# Silence TTS's Synthesizer appends after every sentence it renders
+SENTENCE_PAD_SAMPLES = 10000
+
+# Speaker conditioning + rendered chunk caches (not committed; see .gitignore).
+# CI restores only the latents; the chunk cache speeds up local reruns
+LATENT_CACHE_DIR = os.path.abspath(".cache/xtts_latents")
+CHUNK_CACHE_DIR = os.path.abspath(".cache/xtts_chunks")
+
+# Bump when a change to rendering (to_pcm16 scaling, padding, ...) should
+# invalidate chunks already on disk
+CHUNK_CACHE_VERSION = 1
+
+# Compression + tempo, applied by ffmpeg in a single pass
+POST_FILTERS = (
+    "acompressor=threshold=-22dB:ratio=2.5:attack=5:release=50,"
+    f"atempo={PLAYBACK_SPEED}"
+)
+
 
 # ==================================================
 # UTILS
@@ -71,17 +94,23 @@ def read_script(path: Optional[str]) -> List[str]:
 
 
 def pick_voice() -> str:
-    voices = sorted([
-        os.path.join(VOICES_DIR, f)
-        for f in os.listdir(VOICES_DIR)
-        if f.lower().endswith((".wav", ".mp3"))
-    ])
+    voice = os.environ.get("TTS_VOICE")
+
+    if not voice:
+        # Single pass; only the first voice in name order is needed
+        with os.scandir(VOICES_DIR) as entries:
+            voice = min(
+                (
+                    e.path for e in entries
+                    if e.name.lower().endswith(VOICE_EXTENSIONS) and e.is_file()
+                ),
+                default=None,
+            )
+
+        if not voice:
+            log(f"ERROR: No cloned voices found in {VOICES_DIR}")
+            sys.exit(1)
 
-    if not voices:
-        log(f"ERROR: No cloned voices found in {VOICES_DIR}")
-        sys.exit(1)
-
-    voice = os.environ.get("TTS_VOICE") or voices[0]
     log(f"Using cloned voice: {os.path.basename(voice)}")
     return os.path.abspath(voice)
 
@@ -140,11 +169,212 @@ def split_text(text: str, max_words: int) -> List[str]:
 # AUDIO POST
 # ==================================================
 
-def post_process(audio: AudioSegment) -> AudioSegment:
-    audio = effects.normalize(audio)
-    audio = compress_dynamic_range(audio, threshold=-22.0, ratio=2.5)
-    audio = effects.speedup(audio, playback_speed=PLAYBACK_SPEED)
-    return audio.set_frame_rate(OUTPUT_RATE).set_channels(1)
+def peak_abs(samples: np.ndarray) -> float:
+    """Largest absolute sample, without materializing np.abs(samples)."""
+    if not samples.size:
+        return 0.0
+    return float(max(samples.max(), -samples.min()))
+
+
+def normalize_gain(samples: np.ndarray) -> float:
+    """
+    Linear gain that peak-normalizes samples to NORMALIZE_HEADROOM_DB
+    below full scale, where full scale for ffmpeg float input is 1.0.
+    """
+    peak = peak_abs(samples)
+    if not peak:
+        return 1.0
+    return NORMALIZE_PEAK / peak
+
+
+def post_process(samples: np.ndarray, rate: int, output_path: str) -> None:
+    """
+    Normalize, compress, speed up and resample in one ffmpeg call.
+    The float mix goes in over stdin untouched; the normalize gain is
+    applied by ffmpeg's volume filter rather than per sample in Python.
+    """
+    pcm = np.asarray(samples, dtype=np.float32)
+    gain = normalize_gain(pcm)
+
+    # Render beside the target and swap in, so a failed run never
+    # leaves a truncated narration for the next pipeline step
+    tmp_path = output_path + ".tmp"
+
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "f32le",
+        "-ar", str(rate),
+        "-ac", "1",
+        "-i", "pipe:0",
+        "-af", f"volume={gain:.10g},{POST_FILTERS}",
+        "-ar", str(OUTPUT_RATE),
+        "-ac", "1",
+        "-c:a", "pcm_s16le",
+        "-f", "wav",
+        tmp_path,
+    ]
+
+    try:
+        subprocess.run(cmd, input=pcm.tobytes(), check=True)
+        os.replace(tmp_path, output_path)
+    except (OSError, subprocess.CalledProcessError) as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        log(f"ERROR: ffmpeg post-processing failed: {e}")
+        sys.exit(1)
+
+
+def crossfade_concat(parts: List[np.ndarray], rate: int, crossfade_ms: int) -> np.ndarray:
+    """
+    Join mono segments with linear crossfades into one preallocated buffer.
+    Same result as chained AudioSegment.append(crossfade=...), without
+    re-copying the whole accumulated buffer on every join.
+    """
+    # float32 throughout: int16 output never needs float64 precision
+    parts = [np.asarray(p, dtype=np.float32) for p in parts]
+    xf = int(rate * crossfade_ms / 1000)
+
+    # Overlap per join is capped by the segment written just before it
+    overlaps = []
+    last = len(parts[0])
+    for arr in parts[1:]:
+        n = min(xf, last, len(arr))
+        overlaps.append(n)
+        last = len(arr) - n
+
+    out = np.empty(sum(map(len, parts)) - sum(overlaps), dtype=np.float32)
+    pos = len(parts[0])
+    out[:pos] = parts[0]
+
+    # Envelopes and scratch are built once per join run, not per join
+    fade_in = np.linspace(0.0, 1.0, xf, dtype=np.float32)
+    fade_out = 1.0 - fade_in
+    scratch = np.empty(xf, dtype=np.float32)
+
+    for arr, n in zip(parts[1:], overlaps):
+        if n:
+            if n == xf:
+                ramp_in, ramp_out = fade_in, fade_out
+            else:
+                # Segment shorter than the crossfade: rare, build to size
+                ramp_in = np.linspace(0.0, 1.0, n, dtype=np.float32)
+                ramp_out = 1.0 - ramp_in
+            tail = out[pos - n:pos]
+            tail *= ramp_out
+            tail += np.multiply(arr[:n], ramp_in, out=scratch[:n])
+        rest = len(arr) - n
+        out[pos:pos + rest] = arr[n:]
+        pos += rest
+
+    return out
+
+
+def to_pcm16(wav, pad: int = 0) -> np.ndarray:
+    """
+    Scale raw XTTS float output to int16 range as float32, peak-normalized
+    per chunk exactly like TTS's save_wav did for the old temp files.
+    The scaled samples are written straight into a buffer that already
+    holds the trailing pad of silence, so no pad/copy temporaries.
+    """
+    raw = np.asarray(wav, dtype=np.float32).ravel()
+    out = np.zeros(raw.size + pad, dtype=np.float32)
+    scale = np.float32(PCM16_FULL_SCALE / max(0.01, peak_abs(raw)))
+    np.multiply(raw, scale, out=out[:raw.size])
+    return out
+
+
+# ==================================================
+# SPEAKER CONDITIONING
+# ==================================================
+
+def voice_cache_key(model_name: str, voice: str) -> str:
+    """
+    Identifies a voice file + model pair; changes when the voice is edited.
+    Keyed on content, not mtime, since a CI checkout resets every mtime.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    with open(voice, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return "{}-{}-{}".format(
+        os.path.splitext(os.path.basename(voice))[0],
+        digest.hexdigest(),
+        model_name.replace("/", "_"),
+    )
+
+
+def load_conditioning(model, voice: str, voice_key: str, device: str):
+    """
+    XTTS speaker latents for the cloned voice.
+    tts.tts() recomputes these from the reference audio on every chunk;
+    compute them once per run. The file under LATENT_CACHE_DIR also lets
+    later runs skip the computation while the voice is unchanged (CI
+    restores that directory with actions/cache).
+    """
+    cache_path = os.path.join(LATENT_CACHE_DIR, voice_key + ".pt")
+
+    if os.path.isfile(cache_path):
+        try:
+            cached = torch.load(cache_path, map_location=device)
+            log("Using cached speaker conditioning")
+            return cached["gpt_cond_latent"], cached["speaker_embedding"]
+        except Exception as e:
+            log(f"WARNING: Ignoring unreadable latent cache: {e}")
+
+    cfg = model.config
+    gpt_cond_latent, speaker_embedding = model.get_conditioning_latents(
+        audio_path=[voice],
+        gpt_cond_len=cfg.gpt_cond_len,
+        gpt_cond_chunk_len=cfg.gpt_cond_chunk_len,
+        max_ref_length=cfg.max_ref_len,
+        sound_norm_refs=cfg.sound_norm_refs,
+    )
+
+    try:
+        os.makedirs(LATENT_CACHE_DIR, exist_ok=True)
+        torch.save(
+            {"gpt_cond_latent": gpt_cond_latent, "speaker_embedding": speaker_embedding},
+            cache_path,
+        )
+    except OSError as e:
+        log(f"WARNING: Could not cache speaker conditioning: {e}")
+
+    return gpt_cond_latent, speaker_embedding
+
+
+def chunk_cache_path(voice_key: str, text: str, settings: dict) -> str:
+    # Everything that shapes the rendered samples is part of the key
+    key = "\n".join([
+        str(CHUNK_CACHE_VERSION),
+        voice_key,
+        repr(sorted(settings.items())),
+        str(SENTENCE_PAD_SAMPLES),
+        str(PCM16_FULL_SCALE),
+        text,
+    ])
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(CHUNK_CACHE_DIR, digest + ".npy")
+
+
+def load_cached_chunk(path: str) -> Optional[np.ndarray]:
+    if not os.path.isfile(path):
+        return None
+    try:
+        return np.load(path).astype(np.float32, copy=False)
+    except (OSError, ValueError) as e:
+        log(f"WARNING: Ignoring unreadable chunk cache: {e}")
+        return None
+
+
+def save_cached_chunk(path: str, samples: np.ndarray) -> None:
+    try:
+        os.makedirs(CHUNK_CACHE_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, samples)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log(f"WARNING: Could not cache chunk: {e}")
 
 
 # ==================================================
@@ -163,47 +393,69 @@ def synthesize(
     tts = TTS(model_name=model_name, progress_bar=False)
     tts.to(device)
 
-    audio_parts: List[AudioSegment] = []
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        for idx, line in enumerate(script_lines):
-            tag = tag_line(line, idx, len(script_lines))
-
-            if tag == "WHISPER":
-                max_words = MAX_WORDS_WHISPER
-                line = line.lower()
-            elif tag == "FIRM":
-                max_words = MAX_WORDS_FIRM
-                line = line.upper()
-            else:
-                max_words = MAX_WORDS_NEUTRAL
-
-            chunks = split_text(line, max_words)
-
-            for i, chunk in enumerate(chunks):
-                tmp_wav = os.path.join(tmpdir, f"seg_{idx}_{i}.wav")
-                log(f"{tag}: {chunk}")
-
-                tts.tts_to_file(
-                    text=chunk,
-                    file_path=tmp_wav,
-                    speaker_wav=voice,
-                    language="en",
-                    split_sentences=False
-                )
+    model = tts.synthesizer.tts_model
+    rate = tts.synthesizer.output_sample_rate
+    voice_key = voice_cache_key(model_name, voice)
+    gpt_cond_latent, speaker_embedding = load_conditioning(
+        model, voice, voice_key, device
+    )
 
-                audio_parts.append(AudioSegment.from_file(tmp_wav))
+    # Same sampling settings tts.tts() takes from the model config
+    cfg = model.config
+    settings = {
+        "temperature": cfg.temperature,
+        "length_penalty": cfg.length_penalty,
+        "repetition_penalty": cfg.repetition_penalty,
+        "top_k": cfg.top_k,
+        "top_p": cfg.top_p,
+    }
+
+    audio_parts: List[np.ndarray] = []
+
+    for idx, line in enumerate(script_lines):
+        tag = tag_line(line, idx, len(script_lines))
+
+        if tag == "WHISPER":
+            max_words = MAX_WORDS_WHISPER
+            line = line.lower()
+        elif tag == "FIRM":
+            max_words = MAX_WORDS_FIRM
+            line = line.upper()
+        else:
+            max_words = MAX_WORDS_NEUTRAL
+
+        chunks = split_text(line, max_words)
+
+        for chunk in chunks:
+            log(f"{tag}: {chunk}")
+
+            # Local reruns of the same script reuse earlier renders
+            cache_path = chunk_cache_path(voice_key, chunk, settings)
+            cached = load_cached_chunk(cache_path)
+            if cached is not None:
+                audio_parts.append(cached)
+                continue
+
+            # Keep samples in memory; no temp wav write + decode per chunk
+            out = model.inference(
+                chunk,
+                "en",
+                gpt_cond_latent,
+                speaker_embedding,
+                enable_text_splitting=False,
+                **settings
+            )
+
+            part = to_pcm16(out["wav"], SENTENCE_PAD_SAMPLES)
+            save_cached_chunk(cache_path, part)
+            audio_parts.append(part)
 
     if not audio_parts:
         log("ERROR: No audio produced")
         sys.exit(1)
 
-    final = audio_parts[0]
-    for part in audio_parts[1:]:
-        final = final.append(part, crossfade=CROSSFADE_MS)
-
-    final = post_process(final)
-    final.export(output_path, format="wav")
+    mixed = crossfade_concat(audio_parts, rate, CROSSFADE_MS)
+    post_process(mixed, rate, output_path)
 
     log(f"✅ Narration complete: {output_path}")
 
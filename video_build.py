@@ -17,11 +17,15 @@ GUARANTEES
 """
 
 import json
+import os
 import subprocess
 import tempfile
 import shutil
 import sys
+import wave
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -34,6 +38,7 @@ HEIGHT = 3840
 FPS = 30
 
 VIDEO_CODEC = "libx264"
+HW_ENCODERS = ["h264_nvenc", "h264_videotoolbox"]
 PIX_FMT = "yuv420p"
 CRF = "18"
 
@@ -41,6 +46,9 @@ CRF = "18"
 MAXRATE = "25M"
 BUFSIZE = "50M"
 
+# Clips rendered at once; 0 = pick from CPU count / encoder
+CLIP_WORKERS = int(os.environ.get("CLIP_WORKERS", "0"))
+
 BEATS_FILE = Path("beats.json")
 ASSET_DIR = Path("asset")
 AUDIO_FILE = Path("final_audio.wav")
@@ -77,6 +85,13 @@ def probe_json(path):
 
 
 def get_audio_duration():
+    # PCM WAV: length comes straight from the header, no ffprobe spawn
+    try:
+        with wave.open(str(AUDIO_FILE)) as w:
+            return w.getnframes() / w.getframerate()
+    except (wave.Error, EOFError):
+        pass
+
     r = subprocess.run(
         ["ffprobe","-v","error","-show_entries","format=duration","-of","csv=p=0",str(AUDIO_FILE)],
         capture_output=True,text=True
@@ -84,6 +99,92 @@ def get_audio_duration():
     return float(r.stdout.strip())
 
 
+@lru_cache(maxsize=1)
+def detect_encoder():
+    """
+    Pick a working H.264 hardware encoder, falling back to libx264.
+    VIDEO_ENCODER overrides the probe. Listing an encoder is not enough
+    (builds ship NVENC without a GPU), so each candidate gets a tiny
+    test encode.
+    """
+    forced = os.environ.get("VIDEO_ENCODER")
+    if forced:
+        return forced
+
+    r = subprocess.run(
+        ["ffmpeg","-hide_banner","-encoders"],
+        capture_output=True,text=True
+    )
+
+    for enc in HW_ENCODERS:
+        if enc not in r.stdout:
+            continue
+        test = subprocess.run(
+            ["ffmpeg","-hide_banner","-v","error",
+             "-f","lavfi","-i","color=s=256x256:d=0.1",
+             "-c:v",enc,"-f","null","-"],
+            capture_output=True
+        )
+        if test.returncode == 0:
+            log("⚡",f"Hardware encoder: {enc}")
+            return enc
+
+    return VIDEO_CODEC
+
+
+@lru_cache(maxsize=1)
+def clip_workers():
+    if CLIP_WORKERS > 0:
+        return CLIP_WORKERS
+    # Consumer GPUs cap concurrent encode sessions
+    if detect_encoder() != VIDEO_CODEC:
+        return 2
+    return max(1, min(4, (os.cpu_count() or 1) // 2))
+
+
+def clip_threads():
+    # Split cores between parallel x264 jobs instead of oversubscribing
+    return max(1, (os.cpu_count() or 1) // clip_workers())
+
+
+def encoder_args(still=False, threads=0):
+    enc = detect_encoder()
+
+    if enc == "h264_nvenc":
+        return [
+            "-c:v",enc,
+            "-preset","p5","-tune","hq",
+            "-rc","vbr","-cq",CRF,"-b:v","0",
+            "-maxrate",MAXRATE,"-bufsize",BUFSIZE,
+        ]
+
+    if enc == "h264_videotoolbox":
+        return [
+            "-c:v",enc,
+            "-b:v",MAXRATE,
+            "-maxrate",MAXRATE,"-bufsize",BUFSIZE,
+        ]
+
+    args = [
+        "-c:v",enc,
+        "-preset","slow",
+        "-crf",CRF,
+        "-maxrate",MAXRATE,
+        "-bufsize",BUFSIZE,
+        "-threads",str(threads),
+    ]
+
+    # Slow pans over a still: favour detail retention and long GOPs
+    if still:
+        args += [
+            "-tune","stillimage",
+            "-g",str(FPS*2),
+            "-keyint_min",str(FPS*2),
+        ]
+
+    return args
+
+
 def deterministic_choice(key, options):
     h = int(hashlib.md5(key.encode()).hexdigest(), 16)
     return options[h % len(options)]
@@ -100,40 +201,50 @@ def base_scale_pad():
     )
 
 
-def film_look():
+def film_grade():
     return (
         "eq=contrast=1.08:brightness=0.02:saturation=1.08,"
-        "unsharp=5:5:0.8:3:3:0.4,"
-        "vignette=PI/5"
+        "unsharp=5:5:0.8:3:3:0.4"
     )
 
 
-def cinematic_motion(seed):
+def film_look():
+    return film_grade()+",vignette=PI/5"
+
+
+def cinematic_motion(seed, frames):
+    """
+    Motion for a single decoded still. zoompan emits every output frame
+    from one input frame; the crop moves run on a looped copy of it, so
+    the image is decoded and scaled once per clip instead of per frame.
+    """
     motion = deterministic_choice(seed, ["push","pan_left","pan_right","drift","hold"])
 
+    hold = f"loop=loop={frames - 1}:size=1,setpts=N/{FPS}/TB"
+
     if motion == "push":
         return (
             "zoompan="
             "z='min(1+on*0.0006,1.15)':"
             "x='iw/2-(iw/zoom/2)':"
             "y='ih/2-(ih/zoom/2)':"
-            "d=1"
+            f"d={frames}:s={WIDTH}x{HEIGHT}:fps={FPS}"
         )
 
     if motion == "pan_left":
-        return f"crop={WIDTH}:{HEIGHT}:x='max(iw-{WIDTH}-t*40,0)':y='(ih-{HEIGHT})/2'"
+        return hold+f",crop={WIDTH}:{HEIGHT}:x='max(iw-{WIDTH}-t*40,0)':y='(ih-{HEIGHT})/2'"
 
     if motion == "pan_right":
-        return f"crop={WIDTH}:{HEIGHT}:x='min(t*40,iw-{WIDTH})':y='(ih-{HEIGHT})/2'"
+        return hold+f",crop={WIDTH}:{HEIGHT}:x='min(t*40,iw-{WIDTH})':y='(ih-{HEIGHT})/2'"
 
     if motion == "drift":
         return (
-            f"crop={WIDTH}:{HEIGHT}:"
+            hold+f",crop={WIDTH}:{HEIGHT}:"
             f"x='min(max(t*15,0),iw-{WIDTH})':"
             f"y='min(max(t*8,0),ih-{HEIGHT})'"
         )
 
-    return "null"
+    return hold
 
 
 # ==========================================================
@@ -162,26 +273,25 @@ class Builder:
     def process_image(self, beat, i):
         src = ASSET_DIR / beat["asset_file"]
         out = self.temp / f"clip_{i:03}.mp4"
-        duration = beat["duration"]
+        frames = max(1, round(beat["duration"] * FPS))
 
+        # Grade the still once before it is repeated; only the vignette
+        # has to follow the motion so it stays locked to the frame
         vf = (
             base_scale_pad()+","+
-            cinematic_motion(src.name)+","+
-            film_look()+","+
-            f"setsar=1,fps={FPS}"
+            film_grade()+","+
+            cinematic_motion(src.name, frames)+","+
+            "vignette=PI/5,"+
+            "setsar=1"
         )
 
         cmd = [
             "ffmpeg","-y",
-            "-loop","1","-i",str(src),
-            "-t",str(duration),
+            "-i",str(src),
             "-vf",vf,
+            "-frames:v",str(frames),
             "-r",str(FPS),
-            "-c:v",VIDEO_CODEC,
-            "-preset","slow",
-            "-crf",CRF,
-            "-maxrate",MAXRATE,
-            "-bufsize",BUFSIZE,
+            *encoder_args(still=True, threads=clip_threads()),
             "-pix_fmt",PIX_FMT,
             "-an",
             "-movflags","+faststart",
@@ -207,11 +317,7 @@ class Builder:
             "-t",str(duration),
             "-vf",vf,
             "-r",str(FPS),
-            "-c:v",VIDEO_CODEC,
-            "-preset","slow",
-            "-crf",CRF,
-            "-maxrate",MAXRATE,
-            "-bufsize",BUFSIZE,
+            *encoder_args(threads=clip_threads()),
             "-pix_fmt",PIX_FMT,
             "-an",
             "-movflags","+faststart",
@@ -223,14 +329,20 @@ class Builder:
     # ------------------------------------------------------
 
     def create_clips(self, beats):
-        log("🎬","Rendering clips")
+        log("🎬",f"Rendering clips ({clip_workers()} parallel)")
 
-        for i,beat in enumerate(beats):
-            clip = self.process_image(beat,i) if beat["type"]=="image" else self.process_video(beat,i)
-            if not clip:
-                return False
-            self.clips.append(clip)
+        def render(item):
+            i,beat = item
+            return self.process_image(beat,i) if beat["type"]=="image" else self.process_video(beat,i)
+
+        # Clips are independent ffmpeg jobs; map keeps timeline order
+        with ThreadPoolExecutor(max_workers=clip_workers()) as pool:
+            clips = list(pool.map(render, enumerate(beats)))
+
+        if not all(clips):
+            return False
 
+        self.clips.extend(clips)
         return True
 
     # ------------------------------------------------------
@@ -265,26 +377,17 @@ class Builder:
     def final_render(self, merged):
         OUTPUT_FILE.parent.mkdir(exist_ok=True)
 
-        vf = (
-            f"scale={WIDTH}:{HEIGHT}:force_original_aspect_ratio=decrease,"
-            f"pad={WIDTH}:{HEIGHT}:(ow-iw)/2:(oh-ih)/2,"
-            "setsar=1"
-        )
-
-        if SUB_FILE.exists():
-            vf += f",ass={SUB_FILE}"
+        # Clips are already WIDTHxHEIGHT at SAR 1, so the only filter
+        # left for this pass is the subtitle burn-in
+        vf = ["-vf",f"ass={SUB_FILE}"] if SUB_FILE.exists() else []
 
         cmd=[
             "ffmpeg","-y",
             "-i",str(merged),
             "-i",str(AUDIO_FILE),
-            "-vf",vf,
+            *vf,
             "-r",str(FPS),
-            "-c:v",VIDEO_CODEC,
-            "-preset","slow",
-            "-crf",CRF,
-            "-maxrate",MAXRATE,
-            "-bufsize",BUFSIZE,
+            *encoder_args(),
             "-pix_fmt",PIX_FMT,
             "-c:a","aac","-b:a","320k",
             "-movflags","+faststart",
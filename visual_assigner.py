@@ -19,10 +19,12 @@ Requires:
 pip install scikit-learn
 """
 
+import heapq
 import json
 import subprocess
 import sys
 import re
+import wave
 from pathlib import Path
 
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -31,6 +33,9 @@ from sklearn.metrics.pairwise import cosine_similarity
 from assets import (
     VIDEO_ASSET_KEYWORDS,
     HOOK_IMAGE_CATEGORIES,
+    VIDEO_ASSET_PATHS,
+    HOOK_IMAGE_PATHS,
+    AssetValidationError,
     validate_video_assets,
     validate_hook_images,
 )
@@ -44,9 +49,6 @@ SCRIPT_FILE = Path("script.txt")
 AUDIO_FILE = Path("final_audio.wav")
 OUTPUT_FILE = Path("beats.json")
 
-ASSET_DIR = Path("asset")
-HOOK_DIR = ASSET_DIR / "hook_static"
-
 TIMELINE_TOLERANCE = 0.01
 MIN_SIM_THRESHOLD = 0.01  # very low → always choose best match
 
@@ -70,6 +72,14 @@ def get_media_duration(path: Path):
     if not path.exists():
         die(f"Missing media: {path}")
 
+    # PCM WAV: length comes straight from the header, no ffprobe spawn
+    if path.suffix.lower() == ".wav":
+        try:
+            with wave.open(str(path)) as w:
+                return w.getnframes() / w.getframerate()
+        except (wave.Error, EOFError):
+            pass
+
     r = subprocess.run(
         [
             "ffprobe",
@@ -93,8 +103,11 @@ def get_media_duration(path: Path):
 # ============================================================
 
 print("🔍 Validating assets...")
-validate_video_assets()
-validate_hook_images()
+try:
+    validate_video_assets()
+    validate_hook_images()
+except AssetValidationError as e:
+    die(str(e))
 
 
 # ============================================================
@@ -153,7 +166,7 @@ VIDEO_DURATIONS = {}
 VIDEO_TEXT = []
 
 for video, keywords in VIDEO_ASSET_KEYWORDS.items():
-    path = ASSET_DIR / video
+    path = VIDEO_ASSET_PATHS[video]
     if not path.exists():
         continue
 
@@ -192,14 +205,12 @@ def select_video(text, used_videos):
 
     sims = cosine_similarity(query_vec, video_vectors)[0]
 
-    # sort by score descending then filename (deterministic)
-    ranked = sorted(
-        [(sims[i], VIDEO_FILES[i]) for i in available],
+    # best score, ties broken by filename (deterministic); O(n), no full sort
+    best_score, best_video = min(
+        ((sims[i], VIDEO_FILES[i]) for i in available),
         key=lambda x: (-x[0], x[1])
     )
 
-    best_score, best_video = ranked[0]
-
     print(f"   → match score {best_score:.3f} : {best_video}")
 
     if best_score < MIN_SIM_THRESHOLD:
@@ -227,18 +238,17 @@ def select_hook_images(text, count=2):
     query_vec = hook_vectorizer.transform([query])
     sims = cosine_similarity(query_vec, hook_vectors)[0]
 
-    ranked = sorted(
-        zip(sims, HOOK_FILES),
-        key=lambda x: (-x[0], x[1])
-    )
+    # heap ordered by score descending then filename; pop only as many
+    # as it takes to find `count` images that exist on disk
+    ranked = [(-score, img) for score, img in zip(sims, HOOK_FILES)]
+    heapq.heapify(ranked)
 
     selected = []
 
-    for score, img in ranked:
-        if (HOOK_DIR / img).exists():
+    while ranked and len(selected) < count:
+        _, img = heapq.heappop(ranked)
+        if HOOK_IMAGE_PATHS[img].exists():
             selected.append(img)
-        if len(selected) == count:
-            break
 
     if len(selected) != count:
         die("Not enough hook images")
@@ -41,9 +41,17 @@ VIDEO_CANDIDATES = [
 SCRIPT_FILE = "script.txt"
 META_FILE = "memory/upload_meta.jsonl"
 
+# Short-lived access token cache. Deliberately outside memory/, which the
+# workflow commits back to the repository.
+TOKEN_CACHE = ".cache/yt_token.json"
+
 CATEGORY_ID = "22"
 UPLOAD_COOLDOWN_MINUTES = 90
 
+# Resumable upload chunk (must be a multiple of 256 KiB).
+# Each chunk is one HTTPS round-trip, so keep it large for 4K files.
+UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
 
 # ==========================================================
 # ENV
@@ -76,16 +84,65 @@ VIDEO_FILE = find_video_file()
 # AUTH
 # ==========================================================
 
-def build_youtube():
-    creds = Credentials(
-        token=None,
+def load_cached_token(client_id):
+    try:
+        with open(TOKEN_CACHE) as f:
+            data = json.load(f)
+
+        if data.get("client_id") != client_id:
+            return None, None
+
+        return data["token"], datetime.fromisoformat(data["expiry"])
+
+    except Exception:
+        return None, None
+
+
+def save_cached_token(creds):
+    if not creds.token or not creds.expiry:
+        return
+
+    try:
+        os.makedirs(os.path.dirname(TOKEN_CACHE), exist_ok=True)
+        fd = os.open(TOKEN_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "client_id": creds.client_id,
+                "token": creds.token,
+                "expiry": creds.expiry.isoformat(),
+            }, f)
+    except Exception as e:
+        print(f"[YT] ⚠️ Could not cache access token: {e}")
+
+
+def build_credentials():
+    """
+    Reuse the cached access token until it expires; google-auth only
+    hits the token endpoint when the cached one is missing or stale.
+    """
+    client_id = require_env("YT_CLIENT_ID")
+    token, expiry = load_cached_token(client_id)
+
+    return Credentials(
+        token=token,
+        expiry=expiry,
         refresh_token=require_env("YT_REFRESH_TOKEN"),
         token_uri="https://oauth2.googleapis.com/token",
-        client_id=require_env("YT_CLIENT_ID"),
+        client_id=client_id,
         client_secret=require_env("YT_CLIENT_SECRET"),
         scopes=["https://www.googleapis.com/auth/youtube.upload"],
     )
-    return build("youtube", "v3", credentials=creds)
+
+
+def build_youtube(creds):
+    # Bundled discovery document: no HTTP fetch, no file-cache probing
+    return build(
+        "youtube",
+        "v3",
+        credentials=creds,
+        static_discovery=True,
+        cache_discovery=False,
+    )
 
 
 # ==========================================================
@@ -244,7 +301,7 @@ def upload_video(youtube, title, description, tags):
         VIDEO_FILE,
         mimetype="video/mp4",
         resumable=True,
-        chunksize=1024 * 1024,
+        chunksize=UPLOAD_CHUNK_SIZE,
     )
 
     print(f"[YT] 🚀 Uploading → {title}")
@@ -301,7 +358,8 @@ def main():
     title = extract_title(script)
     description, tags = build_metadata(script)
 
-    youtube = build_youtube()
+    creds = build_credentials()
+    youtube = build_youtube(creds)
 
     try:
         video_id = upload_video(youtube, title, description, tags)
@@ -314,6 +372,9 @@ def main():
     except Exception as e:
         sys.exit(f"[YT] ❌ Upload failed: {e}")
 
+    finally:
+        save_cached_token(creds)
+
 
 if __name__ == "__main__":
     main()